@@ -6,19 +6,57 @@ A modular idle game with procedural entities and extensible architecture.
 
 import time
 import json
+import math
 import sqlite3
 import random
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+import queue
+import threading
+from array import array
+from itertools import compress
+from collections import defaultdict, deque
+from typing import Dict, List, Set, Any, Optional, Tuple
+from dataclasses import dataclass, asdict, replace
 from abc import ABC, abstractmethod
+from enum import IntEnum
 import os
+import sys
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the pure-Python kernels
+    njit = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
 
 
 # =============================================================================
 # CORE GAME DATA STRUCTURES
 # =============================================================================
 
-@dataclass
+# __slots__-backed dataclasses need Python 3.10+; older interpreters keep __dict__
+_DATACLASS_OPTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+class EType(IntEnum):
+    """Entity types, stored as small ints for cheap compares and compact rows"""
+    GATHERER = 0
+    PHILOSOPHER = 1
+    CARETAKER = 2
+    BUILDER = 3
+    DEFENDER = 4
+
+# Display names, indexed by EType
+_ETYPE_NAMES = tuple(t.name.lower() for t in EType)
+
+def _parse_etype(value) -> EType:
+    """Decode an entity_type column, including legacy TEXT names"""
+    if isinstance(value, str):
+        return EType[value.upper()]
+    return EType(value)
+
+@dataclass(**_DATACLASS_OPTS)
 class EntityTraits:
     """Core traits that affect entity performance"""
     efficiency: float = 1.0
@@ -26,24 +64,40 @@ class EntityTraits:
     cooperation: float = 1.0
     stamina: float = 1.0
 
-@dataclass
+# Traits span a narrow range (~0.05-1.2), so they are held as float32 in the
+# SoA columns and save BLOBs; experience stays float64 since it keeps growing
+_TRAIT_TYPECODE = 'f'
+_TRAIT_REL_TOL = 1e-6
+
+def _quantized_traits(efficiency: float, learning_rate: float,
+                      cooperation: float, stamina: float) -> EntityTraits:
+    """EntityTraits rounded to float32 storage precision"""
+    values = (efficiency, learning_rate, cooperation, stamina)
+    quantized = array(_TRAIT_TYPECODE, values)
+    # float32 overflows to inf rather than raising, so check the round trip
+    if not all(math.isclose(q, v, rel_tol=_TRAIT_REL_TOL) for q, v in zip(quantized, values)):
+        raise ValueError(f"Entity traits {values} do not fit in float32")
+    return EntityTraits(*quantized)
+
+@dataclass(**_DATACLASS_OPTS)
 class Entity:
     """A procedurally generated worker entity"""
     id: str
     name: str
-    entity_type: str  # gatherer, philosopher, caretaker, builder, defender
+    entity_type: EType
     traits: EntityTraits
-    experience: Dict[str, float]  # task -> experience level
+    experience: Dict[str, float]  # task -> experience level (non-gathering tasks)
     current_task: Optional[str] = None
+    gathering_xp: float = 0.0  # hot-path task, kept out of the experience dict
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class Resource:
     """A game resource"""
     name: str
     amount: float = 0.0
     production_rate: float = 0.0
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class GameState:
     """Complete game state"""
     tick: int = 0
@@ -61,11 +115,95 @@ class GameState:
         if self.technologies is None:
             self.technologies = []
 
+@dataclass(**_DATACLASS_OPTS)
+class EntityColumns:
+    """Entities as parallel columns, the layout entities_blob stores"""
+    ids: List[str]
+    names: List[str]
+    tasks: List[Optional[str]]
+    experience: List[Dict[str, float]]
+    entity_type: array
+    efficiency: array
+    learning_rate: array
+    cooperation: array
+    stamina: array
+    gathering_xp: array
+    
+    @classmethod
+    def from_entities(cls, entities) -> "EntityColumns":
+        """Build columns from Entity dataclasses"""
+        entities = list(entities)
+        return cls(
+            ids=[e.id for e in entities],
+            names=[e.name for e in entities],
+            tasks=[e.current_task for e in entities],
+            experience=[e.experience for e in entities],
+            entity_type=array('b', (e.entity_type for e in entities)),
+            efficiency=array(_TRAIT_TYPECODE, (e.traits.efficiency for e in entities)),
+            learning_rate=array(_TRAIT_TYPECODE, (e.traits.learning_rate for e in entities)),
+            cooperation=array(_TRAIT_TYPECODE, (e.traits.cooperation for e in entities)),
+            stamina=array(_TRAIT_TYPECODE, (e.traits.stamina for e in entities)),
+            gathering_xp=array('d', (e.gathering_xp for e in entities))
+        )
+
+
+def _dumps(obj) -> bytes:
+    """Serialize a (dataclass) object to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_DATACLASS)
+    return json.dumps(asdict(obj), separators=(",", ":")).encode()
+
 
 # =============================================================================
 # PERSISTENCE MODULE
 # =============================================================================
 
+# Statements are kept as module constants so every save/load passes the
+# identical string and hits sqlite3's prepared-statement cache
+_SQL_INS_STATE = (
+    "INSERT INTO game_state (id, tick, prestige_tokens, player_boost, updated_at) "
+    "VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP) "
+    "ON CONFLICT(id) DO UPDATE SET tick = excluded.tick, "
+    "prestige_tokens = excluded.prestige_tokens, player_boost = excluded.player_boost, "
+    "updated_at = excluded.updated_at"
+)
+_SQL_INS_RESOURCE = (
+    "INSERT INTO resources (game_id, name, amount, production_rate) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(game_id, name) DO UPDATE SET amount = excluded.amount, "
+    "production_rate = excluded.production_rate"
+)
+_SQL_INS_ENTITIES_BLOB = (
+    "INSERT OR REPLACE INTO entities_blob (game_id, n, labels, entity_type, efficiency, "
+    "learning_rate, cooperation, stamina, gathering_xp) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_INS_TECH = (
+    "INSERT INTO technologies (game_id, tech_name, unlocked_at) VALUES (?, ?, ?) "
+    "ON CONFLICT(game_id, tech_name) DO NOTHING"
+)
+_SQL_SEL_STATE = "SELECT * FROM game_state WHERE id = ?"
+_SQL_SEL_RESOURCES = "SELECT * FROM resources WHERE game_id = ?"
+_SQL_SEL_ENTITIES_BLOB = "SELECT * FROM entities_blob WHERE game_id = ?"
+_SQL_SEL_ENTITIES = "SELECT * FROM entities WHERE game_id = ?"
+_SQL_SEL_EXP = "SELECT entity_id, task_type, experience FROM entity_experience WHERE game_id = ?"
+_SQL_SEL_TECH = "SELECT tech_name FROM technologies WHERE game_id = ?"
+
+def _pack_column(typecode: str, values) -> bytes:
+    """Pack numbers into a little-endian array BLOB"""
+    column = array(typecode, values)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column.tobytes()
+
+def _unpack_column(typecode: str, blob: bytes, n: int) -> array:
+    """Unpack a BLOB written by _pack_column, checking its length"""
+    column = array(typecode)
+    column.frombytes(blob)
+    if len(column) != n:
+        raise ValueError(f"entities_blob column holds {len(column)} values, expected {n}")
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column
+
 class GameDatabase:
     """SQLite persistence layer for game state"""
     
@@ -76,9 +214,21 @@ class GameDatabase:
     
     def _initialize_database(self):
         """Create database tables if they don't exist"""
-        self.connection = sqlite3.connect(self.db_path)
+        # Saves are written from GameLogic's background writer thread
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
         self.connection.row_factory = sqlite3.Row  # Enable dict-like access
-        
+
+        # Tune for frequent small autosaves: WAL + NORMAL sync avoids an
+        # fsync on every commit (WAL is meaningless for in-memory databases)
+        if self.db_path != ":memory:":
+            self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA temp_store=MEMORY")
+        self.connection.execute("PRAGMA cache_size=-65536")  # 64 MB
+        self.connection.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        self.connection.execute("PRAGMA busy_timeout=5000")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+
         cursor = self.connection.cursor()
         
         # Game state table
@@ -111,7 +261,7 @@ class GameDatabase:
                 game_id INTEGER,
                 entity_id TEXT,
                 name TEXT,
-                entity_type TEXT,
+                entity_type INTEGER,
                 current_task TEXT,
                 efficiency REAL,
                 learning_rate REAL,
@@ -134,6 +284,24 @@ class GameDatabase:
             )
         ''')
         
+        # Entities as one row of packed columns per save (replaces the
+        # entities/entity_experience tables, which are now only read to migrate
+        # older saves)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS entities_blob (
+                game_id INTEGER PRIMARY KEY,
+                n INTEGER,
+                labels TEXT,
+                entity_type BLOB,
+                efficiency BLOB,
+                learning_rate BLOB,
+                cooperation BLOB,
+                stamina BLOB,
+                gathering_xp BLOB,
+                FOREIGN KEY (game_id) REFERENCES game_state(id)
+            )
+        ''')
+        
         # Technologies table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS technologies (
@@ -147,67 +315,75 @@ class GameDatabase:
         
         self.connection.commit()
     
-    def save_game_state(self, state: GameState) -> int:
-        """Save complete game state, returns game_id"""
-        cursor = self.connection.cursor()
+    def save_game_state(self, state: GameState,
+                        entities_dirty: bool = True,
+                        dirty_resources: Optional[Set[str]] = None,
+                        entity_columns: Optional[EntityColumns] = None) -> int:
+        """Save game state, returns game_id
+
+        Resource rows are upserted rather than wiped and re-inserted; when a
+        dirty set is given only those resources are written (None means all).
+        Entities are written as a single row of packed columns, skipped when
+        entities_dirty is False; entity_columns, when given, is written instead
+        of state.entities.
+        """
+        game_id = 1  # For now, single save slot
         
-        # Insert or update game state
-        cursor.execute('''
-            INSERT OR REPLACE INTO game_state (id, tick, prestige_tokens, player_boost, updated_at)
-            VALUES (1, ?, ?, ?, CURRENT_TIMESTAMP)
-        ''', (state.tick, state.prestige_tokens, state.player_boost))
+        # Build row batches up front so each table is one executemany call
+        resource_rows = []
+        for name in (state.resources if dirty_resources is None else dirty_resources):
+            resource = state.resources.get(name)
+            if resource is not None:
+                resource_rows.append((game_id, resource.name, resource.amount,
+                                      resource.production_rate))
         
-        game_id = 1  # For now, single save slot
+        entities_row = None
+        if entities_dirty:
+            cols = entity_columns or EntityColumns.from_entities(state.entities.values())
+            labels = json.dumps({
+                "ids": cols.ids,
+                "names": cols.names,
+                "tasks": cols.tasks,
+                "experience": cols.experience
+            })
+            entities_row = (
+                game_id, len(cols.ids), labels,
+                _pack_column('b', cols.entity_type),
+                _pack_column(_TRAIT_TYPECODE, cols.efficiency),
+                _pack_column(_TRAIT_TYPECODE, cols.learning_rate),
+                _pack_column(_TRAIT_TYPECODE, cols.cooperation),
+                _pack_column(_TRAIT_TYPECODE, cols.stamina),
+                _pack_column('d', cols.gathering_xp)
+            )
         
-        # Clear existing data for this game
-        cursor.execute('DELETE FROM resources WHERE game_id = ?', (game_id,))
-        cursor.execute('DELETE FROM entities WHERE game_id = ?', (game_id,))
-        cursor.execute('DELETE FROM entity_experience WHERE game_id = ?', (game_id,))
-        cursor.execute('DELETE FROM technologies WHERE game_id = ?', (game_id,))
-        
-        # Save resources
-        for resource in state.resources.values():
-            cursor.execute('''
-                INSERT INTO resources (game_id, name, amount, production_rate)
-                VALUES (?, ?, ?, ?)
-            ''', (game_id, resource.name, resource.amount, resource.production_rate))
-        
-        # Save entities
-        for entity in state.entities.values():
-            cursor.execute('''
-                INSERT INTO entities (
-                    game_id, entity_id, name, entity_type, current_task,
-                    efficiency, learning_rate, cooperation, stamina
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                game_id, entity.id, entity.name, entity.entity_type, entity.current_task,
-                entity.traits.efficiency, entity.traits.learning_rate,
-                entity.traits.cooperation, entity.traits.stamina
-            ))
+        tech_rows = [(game_id, tech, state.tick) for tech in state.technologies]
+        
+        # Single transaction: one commit (and one sync) per save
+        with self.connection:
+            cursor = self.connection.cursor()
+            
+            # Insert or update game state
+            cursor.execute(_SQL_INS_STATE, (game_id, state.tick, state.prestige_tokens,
+                                            state.player_boost))
+            
+            # Save resources
+            cursor.executemany(_SQL_INS_RESOURCE, resource_rows)
             
-            # Save entity experience
-            for task_type, experience in entity.experience.items():
-                cursor.execute('''
-                    INSERT INTO entity_experience (game_id, entity_id, task_type, experience)
-                    VALUES (?, ?, ?, ?)
-                ''', (game_id, entity.id, task_type, experience))
-        
-        # Save technologies
-        for tech in state.technologies:
-            cursor.execute('''
-                INSERT INTO technologies (game_id, tech_name, unlocked_at)
-                VALUES (?, ?, ?)
-            ''', (game_id, tech, state.tick))
+            # Save entities
+            if entities_row is not None:
+                cursor.execute(_SQL_INS_ENTITIES_BLOB, entities_row)
+            
+            # Save technologies (keep the tick they were first unlocked at)
+            cursor.executemany(_SQL_INS_TECH, tech_rows)
         
-        self.connection.commit()
         return game_id
     
     def load_game_state(self, game_id: int = 1) -> Optional[GameState]:
-        """Load game state from database"""
+        """Load game state from database (one cursor, reused per query)"""
         cursor = self.connection.cursor()
         
         # Load basic game state
-        cursor.execute('SELECT * FROM game_state WHERE id = ?', (game_id,))
+        cursor.execute(_SQL_SEL_STATE, (game_id,))
         game_row = cursor.fetchone()
         
         if not game_row:
@@ -221,7 +397,7 @@ class GameDatabase:
         )
         
         # Load resources
-        cursor.execute('SELECT * FROM resources WHERE game_id = ?', (game_id,))
+        cursor.execute(_SQL_SEL_RESOURCES, (game_id,))
         for row in cursor.fetchall():
             resource = Resource(
                 name=row['name'],
@@ -230,42 +406,81 @@ class GameDatabase:
             )
             state.resources[resource.name] = resource
         
+        # Load entities from the packed columns, or migrate an older save
+        cursor.execute(_SQL_SEL_ENTITIES_BLOB, (game_id,))
+        blob_row = cursor.fetchone()
+        if blob_row:
+            state.entities = self._entities_from_blob(blob_row)
+        else:
+            state.entities = self._entities_from_legacy_rows(cursor, game_id)
+        
+        # Load technologies
+        cursor.execute(_SQL_SEL_TECH, (game_id,))
+        state.technologies = [row['tech_name'] for row in cursor.fetchall()]
+        
+        return state
+    
+    def _entities_from_blob(self, row: sqlite3.Row) -> Dict[str, Entity]:
+        """Rebuild entities from an entities_blob row"""
+        n = row['n']
+        labels = json.loads(row['labels'])
+        entity_types = _unpack_column('b', row['entity_type'], n)
+        efficiency = _unpack_column(_TRAIT_TYPECODE, row['efficiency'], n)
+        learning_rate = _unpack_column(_TRAIT_TYPECODE, row['learning_rate'], n)
+        cooperation = _unpack_column(_TRAIT_TYPECODE, row['cooperation'], n)
+        stamina = _unpack_column(_TRAIT_TYPECODE, row['stamina'], n)
+        gathering_xp = _unpack_column('d', row['gathering_xp'], n)
+        
+        entities = {}
+        for i, entity_id in enumerate(labels['ids']):
+            entities[entity_id] = Entity(
+                id=entity_id,
+                name=labels['names'][i],
+                entity_type=EType(entity_types[i]),
+                traits=_quantized_traits(
+                    efficiency=efficiency[i],
+                    learning_rate=learning_rate[i],
+                    cooperation=cooperation[i],
+                    stamina=stamina[i]
+                ),
+                experience=labels['experience'][i],
+                current_task=labels['tasks'][i],
+                gathering_xp=gathering_xp[i]
+            )
+        return entities
+    
+    def _entities_from_legacy_rows(self, cursor: sqlite3.Cursor, game_id: int) -> Dict[str, Entity]:
+        """Rebuild entities from the row-per-entity tables of older saves"""
+        # Load all entity experience in one query, bucketed by entity
+        cursor.execute(_SQL_SEL_EXP, (game_id,))
+        exp_by_entity: Dict[str, Dict[str, float]] = defaultdict(dict)
+        for row in cursor.fetchall():
+            exp_by_entity[row['entity_id']][row['task_type']] = row['experience']
+        
         # Load entities
-        cursor.execute('SELECT * FROM entities WHERE game_id = ?', (game_id,))
+        entities = {}
+        cursor.execute(_SQL_SEL_ENTITIES, (game_id,))
         for row in cursor.fetchall():
-            traits = EntityTraits(
+            traits = _quantized_traits(
                 efficiency=row['efficiency'],
                 learning_rate=row['learning_rate'],
                 cooperation=row['cooperation'],
                 stamina=row['stamina']
             )
             
+            experience = exp_by_entity.get(row['entity_id'], {})
             entity = Entity(
                 id=row['entity_id'],
                 name=row['name'],
-                entity_type=row['entity_type'],
+                entity_type=_parse_etype(row['entity_type']),
                 traits=traits,
-                experience={},
-                current_task=row['current_task']
+                experience=experience,
+                current_task=row['current_task'],
+                gathering_xp=experience.pop("gathering", 0.0)
             )
             
-            # Load entity experience
-            exp_cursor = self.connection.cursor()
-            exp_cursor.execute('''
-                SELECT task_type, experience FROM entity_experience 
-                WHERE game_id = ? AND entity_id = ?
-            ''', (game_id, entity.id))
-            
-            for exp_row in exp_cursor.fetchall():
-                entity.experience[exp_row['task_type']] = exp_row['experience']
-            
-            state.entities[entity.id] = entity
-        
-        # Load technologies
-        cursor.execute('SELECT tech_name FROM technologies WHERE game_id = ?', (game_id,))
-        state.technologies = [row['tech_name'] for row in cursor.fetchall()]
-        
-        return state
+            entities[entity.id] = entity
+        return entities
     
     def game_exists(self, game_id: int = 1) -> bool:
         """Check if a saved game exists"""
@@ -283,150 +498,429 @@ class GameDatabase:
 # GAME LOGIC MODULE
 # =============================================================================
 
+def _gather_step_loop(eff, xp, lr, task_mask, gatherer_mask):
+    """One fused pass over the SoA columns for a tick of gathering
+    
+    Yield is efficiency * (1 + 10% per experience level). Returns
+    (energy gathered, new production rate) and adds learning_rate to xp in place.
+    """
+    gathered = 0.0
+    rate = 0.0
+    for i in range(len(eff)):
+        if task_mask[i]:
+            x = xp[i]
+            gathered += eff[i] * (1.0 + x * 0.1)
+            x += lr[i]
+            xp[i] = x
+            if gatherer_mask[i]:
+                rate += eff[i] * (1.0 + x * 0.1)
+    return gathered, rate
+
+# Compiled with numba when available, otherwise the same loop runs in Python
+_gather_step = njit(cache=True, fastmath=True)(_gather_step_loop) if njit else _gather_step_loop
+
+# A queued save: dirty-state snapshot, entity columns (None when unchanged),
+# and whether its outcome is announced as a tick event
+_SaveJob = Tuple[GameState, Optional[EntityColumns], bool]
+
+def _merge_save_jobs(older: _SaveJob, newer: _SaveJob) -> _SaveJob:
+    """Fold an older unwritten save into a newer one (newer rows win)"""
+    old_state, old_columns, old_announce = older
+    state, columns, announce = newer
+    state.resources = {**old_state.resources, **state.resources}
+    return (state, columns if columns is not None else old_columns,
+            announce or old_announce)
+
 class GameLogic:
     """Core game logic, separate from I/O and display"""
     
-    def __init__(self, database: Optional[GameDatabase] = None):
+    def __init__(self, database: Optional[GameDatabase] = None, seed: Optional[int] = None):
         self.database = database or GameDatabase()
         self.state = GameState()
+        self._rng = random.Random(seed)
         self.auto_save_interval = 10  # Save every 10 ticks
+        self.full_sync_interval = 10  # Refresh entity views every 10 ticks
+        
+        # What changed since the last save, so autosave only writes that.
+        # Entities are saved as one packed row, so a flag is enough for them.
+        self._entities_dirty = False
+        self._dirty_resources: Set[str] = set()
+        
+        # Structure-of-arrays mirror of the entity fields the tick loop reads;
+        # the Entity dataclasses stay the source of truth for display/saving
+        self._soa_ids: List[str] = []
+        self._soa_index: Dict[str, int] = {}
+        self._eff = array(_TRAIT_TYPECODE)
+        self._lr = array(_TRAIT_TYPECODE)
+        self._coop = array(_TRAIT_TYPECODE)
+        self._stam = array(_TRAIT_TYPECODE)
+        self._exp_gather = array('d')
+        self._mask_gather_task = array('b')  # current_task == "gathering"
+        self._etype_arr = array('b')
+        self._mask_gatherer = array('b')  # ...and entity_type == EType.GATHERER
+        
+        # Save-only columns that never change between SoA rebuilds; the lists
+        # are replaced (not mutated) on rebuild, so snapshots can share them
+        self._soa_names: List[str] = []
+        self._soa_tasks: List[Optional[str]] = []
+        self._soa_experience: List[Dict[str, float]] = []
+        
+        # Display views handed out by tick(), refreshed in place each tick
+        self._entity_view_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Payload returned by tick(), reused and refreshed in place every tick
+        self._tick_payload: Dict[str, Any] = {
+            "tick": 0,
+            "full": True,  # False when only deltas (and events) are fresh
+            "events": [],
+            "deltas": {"resources": {}, "production_rates": {}},
+            "resources": {},
+            "production_rates": {},
+            "entities": self._entity_view_cache
+        }
+        
+        # Saves run on a background writer; at most one snapshot waits in the
+        # queue and newer saves are merged into it
+        self._save_queue: "queue.Queue[Optional[_SaveJob]]" = queue.Queue(maxsize=1)
+        # A failed write's rows are kept here and folded into the next save;
+        # last_save_error stays set until a write succeeds with nothing held back
+        self.last_save_error: Optional[Exception] = None
+        self._unsaved: Optional[_SaveJob] = None
+        self._save_lock = threading.Lock()
+        # Outcomes of announced saves (None or the error), drained by tick()
+        self._save_reports: deque = deque()
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+        
         self._initialize_or_load_game()
     
     def _initialize_or_load_game(self):
         """Load existing game or create new one"""
-        if self.database.game_exists():
-            loaded_state = self.database.load_game_state()
-            if loaded_state:
-                self.state = loaded_state
-                print(f"Loaded existing game at tick {self.state.tick}")
-                return
+        # load_game_state returns None when there is no save, so no separate
+        # game_exists() round trip is needed
+        loaded_state = self.database.load_game_state()
+        if loaded_state:
+            self.state = loaded_state
+            self._rebuild_soa()
+            print(f"Loaded existing game at tick {self.state.tick}")
+            return
         
         # Create new game
         print("Starting new game...")
         self._initialize_base_game()
+        self._rebuild_soa()
         self.save_game()
     
-    def save_game(self):
-        """Save current game state"""
+    def save_game(self, announce: bool = False):
+        """Queue the current game state for saving on the writer thread
+        
+        With announce set, the write's outcome is reported as a system event
+        by a later tick().
+        """
         if self.database:
-            self.database.save_game_state(self.state)
+            job = (*self._snapshot_dirty_state(), announce)
+            with self._save_lock:
+                unsaved, self._unsaved = self._unsaved, None
+            if unsaved is not None:
+                job = _merge_save_jobs(unsaved, job)  # retry what failed last time
+            try:
+                pending = self._save_queue.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                # Coalesce with the snapshot the writer hasn't picked up yet
+                self._save_queue.task_done()
+                job = _merge_save_jobs(pending, job)
+            self._save_queue.put_nowait(job)
+    
+    def _snapshot_dirty_state(self) -> Tuple[GameState, Optional[EntityColumns]]:
+        """Copy what changed since the last save, safe to hand to another thread
+        
+        Entities are saved as one packed row, so they are copied straight from
+        the SoA columns (or left out entirely when unchanged); packing and JSON
+        encoding happen on the writer.
+        """
+        resources = self.state.resources
+        snapshot = GameState(
+            tick=self.state.tick,
+            resources={name: replace(resources[name])
+                       for name in self._dirty_resources if name in resources},
+            technologies=list(self.state.technologies),
+            prestige_tokens=self.state.prestige_tokens,
+            player_boost=self.state.player_boost
+        )
+        columns = None
+        if self._entities_dirty:
+            columns = EntityColumns(
+                ids=self._soa_ids,
+                names=self._soa_names,
+                tasks=self._soa_tasks,
+                experience=self._soa_experience,
+                entity_type=array('b', self._etype_arr),
+                efficiency=array(_TRAIT_TYPECODE, self._eff),
+                learning_rate=array(_TRAIT_TYPECODE, self._lr),
+                cooperation=array(_TRAIT_TYPECODE, self._coop),
+                stamina=array(_TRAIT_TYPECODE, self._stam),
+                gathering_xp=array('d', self._exp_gather)
+            )
+        self._entities_dirty = False
+        self._dirty_resources.clear()
+        return snapshot, columns
+    
+    def _writer_loop(self):
+        """Background thread: write queued snapshots until the None sentinel"""
+        while True:
+            job = self._save_queue.get()
+            try:
+                if job is None:
+                    return
+                snapshot, columns, announce = job
+                self.database.save_game_state(snapshot, columns is not None,
+                                              snapshot.resources.keys(), columns)
+                with self._save_lock:
+                    if self._unsaved is None:
+                        self.last_save_error = None
+                if announce:
+                    self._save_reports.append(None)
+            except Exception as e:
+                # Any failure is reported, not fatal: a dead writer would leave
+                # flush_saves()/close() waiting on the queue forever. The rows
+                # are held back so the next save retries them.
+                with self._save_lock:
+                    if self._unsaved is not None:
+                        job = _merge_save_jobs(self._unsaved, job)
+                    self._unsaved = job
+                    self.last_save_error = e
+                if job[2]:
+                    self._save_reports.append(e)
+            finally:
+                self._save_queue.task_done()
+    
+    def flush_saves(self):
+        """Block until every queued save has been written"""
+        self._save_queue.join()
+    
+    def close(self):
+        """Flush pending saves and stop the writer thread
+        
+        Raises the last save error if the final state could not be written.
+        """
+        self.flush_saves()
+        self._save_queue.put(None)
+        self._writer_thread.join()
+        if self.last_save_error is not None:
+            raise self.last_save_error
     
     def _initialize_base_game(self):
         """Set up starting conditions"""
         # Start with basic resource
         self.state.resources["energy"] = Resource("energy", amount=10.0)
+        self._dirty_resources.add("energy")
         
         # Generate starting entities
-        for i in range(3):
-            entity = self._generate_entity(f"entity_{i}", "gatherer")
+        for entity in self._generate_entities_bulk(3, EType.GATHERER):
             self.state.entities[entity.id] = entity
+        self._entities_dirty = True
+    
+    def _generate_entity(self, entity_id: str, entity_type: EType) -> Entity:
+        """Generate a single procedural entity"""
+        entity = self._generate_entities_bulk(1, entity_type)[0]
+        entity.id = entity_id
+        return entity
     
-    def _generate_entity(self, entity_id: str, entity_type: str) -> Entity:
-        """Generate a procedural entity"""
+    def _generate_entities_bulk(self, count: int, entity_type: EType,
+                                start_index: int = 0) -> List[Entity]:
+        """Generate procedural entities with ids entity_<start_index>..."""
         names = ["Zara", "Kael", "Luna", "Orion", "Nova", "Sage", "Echo", "Zen"]
         
-        # Procedural traits with some randomization
-        traits = EntityTraits(
-            efficiency=random.uniform(0.8, 1.2),
-            learning_rate=random.uniform(0.05, 0.15),
-            cooperation=random.uniform(0.9, 1.1),
-            stamina=random.uniform(0.8, 1.2)
-        )
+        # All trait rolls drawn up front, four per entity
+        rnd = self._rng.random
+        rolls = [rnd() for _ in range(4 * count)]
+        picked_names = self._rng.choices(names, k=count)
         
-        return Entity(
-            id=entity_id,
-            name=random.choice(names),
-            entity_type=entity_type,
-            traits=traits,
-            experience={"gathering": 0.0},
-            current_task="gathering"
-        )
+        # Procedural traits with some randomization
+        entities = []
+        for i in range(count):
+            u_eff, u_lr, u_coop, u_stam = rolls[4 * i:4 * i + 4]
+            traits = _quantized_traits(
+                efficiency=0.8 + 0.4 * u_eff,
+                learning_rate=0.05 + 0.1 * u_lr,
+                cooperation=0.9 + 0.2 * u_coop,
+                stamina=0.8 + 0.4 * u_stam
+            )
+            entities.append(Entity(
+                id=f"entity_{start_index + i}",
+                name=picked_names[i],
+                entity_type=entity_type,
+                traits=traits,
+                experience={},
+                current_task="gathering"
+            ))
+        return entities
+    
+    def _rebuild_soa(self):
+        """Rebuild the structure-of-arrays mirror from the entity dataclasses"""
+        entities = list(self.state.entities.values())
+        self._soa_ids = [e.id for e in entities]
+        self._soa_index = {eid: i for i, eid in enumerate(self._soa_ids)}
+        self._eff = array(_TRAIT_TYPECODE, (e.traits.efficiency for e in entities))
+        self._lr = array(_TRAIT_TYPECODE, (e.traits.learning_rate for e in entities))
+        self._coop = array(_TRAIT_TYPECODE, (e.traits.cooperation for e in entities))
+        self._stam = array(_TRAIT_TYPECODE, (e.traits.stamina for e in entities))
+        self._exp_gather = array('d', (e.gathering_xp for e in entities))
+        self._mask_gather_task = array('b', (e.current_task == "gathering" for e in entities))
+        self._etype_arr = array('b', (e.entity_type for e in entities))
+        self._mask_gatherer = array('b', (m and t == EType.GATHERER
+                                          for m, t in zip(self._mask_gather_task, self._etype_arr)))
+        self._soa_names = [e.name for e in entities]
+        self._soa_tasks = [e.current_task for e in entities]
+        self._soa_experience = [e.experience for e in entities]
+        self._entity_view_cache.clear()
+    
+    def _sync_entity_from_soa(self, entity: Entity):
+        """Copy array-held experience back onto a single entity dataclass"""
+        i = self._soa_index.get(entity.id)
+        if i is not None:
+            entity.gathering_xp = self._exp_gather[i]
+    
+    def _sync_entities_from_soa(self):
+        """Copy array-held experience back onto every gathering entity"""
+        entities = self.state.entities
+        for eid, xp in compress(zip(self._soa_ids, self._exp_gather), self._mask_gather_task):
+            entities[eid].gathering_xp = xp
     
     def tick(self) -> Dict[str, Any]:
-        """Execute one game tick - returns events for display"""
-        self.state.tick += 1
-        events = []
+        """Execute one game tick - returns events for display
         
-        # Process entity actions
-        for entity in self.state.entities.values():
-            event = self._process_entity_action(entity)
-            if event:
-                events.append(event)
+        The returned dict (and its sub-dicts) is reused across ticks; callers
+        must not hold on to it past the next tick or mutate anything but events.
+        Entity views are refreshed only when payload["full"] is set (every
+        full_sync_interval ticks); payload["deltas"] lists resources that changed.
+        """
+        self.state.tick += 1
         
-        # Update resource production rates
-        self._update_production_rates()
+        # Process entity actions (also updates production rates)
+        events = self._process_entity_actions()
         
         # Apply resource production
         for resource in self.state.resources.values():
             if resource.production_rate > 0:
                 resource.amount += resource.production_rate
+                self._dirty_resources.add(resource.name)
         
         # Auto-save periodically
+        # Auto-save periodically; writes are asynchronous, so the outcome is
+        # reported on whichever tick sees the writer finish
         if self.state.tick % self.auto_save_interval == 0:
-            self.save_game()
+            self.save_game(announce=True)
+        while self._save_reports:
+            error = self._save_reports.popleft()
             events.append({
                 "type": "system",
-                "message": "Game auto-saved"
+                "message": "Game auto-saved" if error is None else f"Auto-save failed: {error}"
             })
         
-        return {
-            "tick": self.state.tick,
-            "events": events,
-            "resources": {name: r.amount for name, r in self.state.resources.items()},
-            "production_rates": {name: r.production_rate for name, r in self.state.resources.items()},
-            "entities": {eid: self._entity_to_dict(entity) for eid, entity in self.state.entities.items()}
-        }
+        payload = self._tick_payload
+        # Views are also built on the first tick after an SoA rebuild clears them
+        full = not self._entity_view_cache or self.state.tick % self.full_sync_interval == 0
+        payload["tick"] = self.state.tick
+        payload["full"] = full
+        payload["events"] = events
+        
+        # Resource maps are always current; deltas list only what changed
+        amounts = payload["resources"]
+        rates = payload["production_rates"]
+        amount_deltas = payload["deltas"]["resources"]
+        rate_deltas = payload["deltas"]["production_rates"]
+        amount_deltas.clear()
+        rate_deltas.clear()
+        for name, r in self.state.resources.items():
+            if amounts.get(name) != r.amount:
+                amounts[name] = amount_deltas[name] = r.amount
+            if rates.get(name) != r.production_rate:
+                rates[name] = rate_deltas[name] = r.production_rate
+        
+        # Entity views are only rebuilt on full-sync frames
+        if full:
+            self._refresh_entity_views()
+        return payload
     
-    def _entity_to_dict(self, entity: Entity) -> Dict[str, Any]:
-        """Convert entity to dictionary for display"""
-        return {
-            "id": entity.id,
-            "name": entity.name,
-            "type": entity.entity_type,
-            "task": entity.current_task or "idle",
-            "efficiency": entity.traits.efficiency,
-            "experience": sum(entity.experience.values()),
-            "traits": asdict(entity.traits)
-        }
+    def _refresh_entity_views(self):
+        """Refresh the cached display views in place"""
+        for entity in self.state.entities.values():
+            self._entity_to_dict(entity)
     
-    def _process_entity_action(self, entity: Entity) -> Optional[Dict[str, Any]]:
-        """Process a single entity's action for this tick"""
-        if entity.current_task == "gathering":
-            # Calculate efficiency based on traits and experience
-            base_gathering = 1.0
-            efficiency_mult = entity.traits.efficiency
-            experience_mult = 1.0 + (entity.experience.get("gathering", 0) * 0.1)
-            
-            gathered = base_gathering * efficiency_mult * experience_mult
-            
-            # Add to energy resource
-            if "energy" in self.state.resources:
-                self.state.resources["energy"].amount += gathered
-            
-            # Gain experience
-            entity.experience["gathering"] = entity.experience.get("gathering", 0) + entity.traits.learning_rate
-            
-            # Occasional event for interest
-            if random.random() < 0.05:  # 5% chance
-                return {
-                    "type": "discovery",
-                    "entity": entity.name,
-                    "message": f"{entity.name} found an efficient energy source!"
+    def _entity_to_dict(self, entity: Entity) -> Dict[str, Any]:
+        """Convert entity to dictionary for display, reusing the cached view"""
+        self._sync_entity_from_soa(entity)
+        view = self._entity_view_cache.get(entity.id)
+        if view is None:
+            # Static fields are filled once; traits never change after creation
+            t = entity.traits
+            view = self._entity_view_cache[entity.id] = {
+                "id": entity.id,
+                "name": entity.name,
+                "type": _ETYPE_NAMES[entity.entity_type],
+                "task": None,
+                "efficiency": None,
+                "experience": None,
+                "traits": {
+                    "efficiency": t.efficiency,
+                    "learning_rate": t.learning_rate,
+                    "cooperation": t.cooperation,
+                    "stamina": t.stamina
                 }
-        
-        return None
+            }
+        view["task"] = entity.current_task or "idle"
+        view["efficiency"] = entity.traits.efficiency
+        view["experience"] = entity.gathering_xp + sum(entity.experience.values())
+        return view
     
-    def _update_production_rates(self):
-        """Update production rates based on current state"""
-        # For now, production rate is just sum of active gatherers
-        gatherers = [e for e in self.state.entities.values() 
-                    if e.entity_type == "gatherer" and e.current_task == "gathering"]
+    def _process_entity_actions(self) -> List[Dict[str, Any]]:
+        """Process every entity's action for this tick over the SoA arrays"""
+        events = []
+        mask = self._mask_gather_task
         
-        energy_rate = sum(e.traits.efficiency * (1.0 + e.experience.get("gathering", 0) * 0.1) 
-                         for e in gatherers)
+        # Gather, gain experience and total the production rate in one pass;
+        # the rate is just the sum of active gatherers' post-gain yield
+        gathered, energy_rate = _gather_step(self._eff, self._exp_gather, self._lr,
+                                             mask, self._mask_gatherer)
         
+        # Add to energy resource
         if "energy" in self.state.resources:
-            self.state.resources["energy"].production_rate = energy_rate
+            energy = self.state.resources["energy"]
+            energy.amount += gathered
+            energy.production_rate = energy_rate
+            self._dirty_resources.add("energy")
+        
+        # Occasional event for interest (5% chance per gatherer)
+        gatherer_ids = list(compress(self._soa_ids, mask))
+        if gatherer_ids:
+            self._entities_dirty = True  # their experience just changed
+        for i in self._roll_successes(len(gatherer_ids), 0.05):
+            name = self.state.entities[gatherer_ids[i]].name
+            events.append({
+                "type": "discovery",
+                "entity": name,
+                "message": f"{name} found an efficient energy source!"
+            })
+        
+        return events
+    
+    def _roll_successes(self, trials: int, chance: float) -> List[int]:
+        """Indices of the trials that succeed, without rolling each one
+        
+        Gaps between successes are geometrically distributed, so skipping
+        straight to the next success needs ~trials * chance draws, not one per trial.
+        """
+        successes = []
+        log_miss = math.log(1.0 - chance)
+        i = -1
+        while True:
+            i += 1 + int(math.log(1.0 - self._rng.random()) / log_miss)
+            if i >= trials:
+                return successes
+            successes.append(i)
     
     def apply_player_boost(self, entity_id: str, boost_multiplier: float = 2.0):
         """Apply manual player boost to an entity"""
@@ -436,12 +930,18 @@ class GameLogic:
                 boosted_amount = boost_multiplier * entity.traits.efficiency
                 if "energy" in self.state.resources:
                     self.state.resources["energy"].amount += boosted_amount
+                    self._dirty_resources.add("energy")
                 return f"Boosted {entity.name} for +{boosted_amount:.1f} energy!"
         return "Boost failed!"
     
     def get_game_state(self) -> GameState:
         """Get current game state (for saving/display)"""
+        self._sync_entities_from_soa()
         return self.state
+    
+    def export_snapshot(self) -> bytes:
+        """Serialize the current game state to compact JSON bytes"""
+        return _dumps(self.get_game_state())
 
 
 # =============================================================================
@@ -565,7 +1065,10 @@ class IdleStuffGame:
                 self.running = False
             elif cmd == "save":
                 self.logic.save_game()
-                self.last_boost_message = "Game saved manually!"
+                self.logic.flush_saves()  # report the outcome of this save
+                error = self.logic.last_save_error
+                self.last_boost_message = ("Game saved manually!" if error is None
+                                           else f"Save failed: {error}")
             elif cmd.startswith("boost:"):
                 entity_id = cmd.split(":", 1)[1]
                 result = self.logic.apply_player_boost(entity_id)
@@ -583,8 +1086,11 @@ class IdleStuffGame:
     def _shutdown(self):
         """Clean shutdown with save"""
         self.logic.save_game()
-        self.display.cleanup()
-        self.database.close()
+        try:
+            self.logic.close()  # raises if the final save failed
+        finally:
+            self.display.cleanup()
+            self.database.close()
 
 
 # =============================================================================
@@ -9,6 +9,35 @@ import time
 import threading
 import queue
 from collections import deque
+from functools import lru_cache
+
+
+# Fixed field widths for resource rows; every field is written at full width
+# so a shorter value overwrites the previous one without clearing the window
+NAME_W = 12
+AMOUNT_W = 10
+RATE_W = 16
+
+# Narrowest terminal the panels are laid out for
+MIN_WIDTH = 40
+
+# Row text is formatted from values bucketed to display precision, so rows
+# whose visible text is unchanged reuse the same strings frame after frame
+@lru_cache(maxsize=512)
+def _fmt_resource(label, amount_tenths, rate_hundredths):
+    """Return the (name, amount, rate) fields for a resource row, pre-padded
+    so the row can be written as one run of consecutive addstr calls"""
+    rate_str = f"(+{rate_hundredths / 100:.2f}/tick)" if rate_hundredths > 0 else ""
+    return (f"{label + ':':<{NAME_W}.{NAME_W}} ",
+            f"{f'{amount_tenths / 10:.1f}':<{AMOUNT_W}.{AMOUNT_W}} ",
+            f"{rate_str:<{RATE_W}.{RATE_W}}")
+
+
+@lru_cache(maxsize=512)
+def _fmt_entity(name, entity_type, task, eff_tenths, exp_tenths):
+    """Return the (info, stats) lines for an entity"""
+    return (f"{name} ({entity_type}) - {task}",
+            f"  Eff: {eff_tenths / 10:.1f} | Exp: {exp_tenths / 10:.1f}")
 
 
 class NCursesDisplay:
@@ -18,10 +47,38 @@ class NCursesDisplay:
         self.stdscr = None
         self.windows = {}
         self.colors_initialized = False
-        self.event_log = deque(maxlen=20)  # Keep last 20 events
+        self.event_log = deque(maxlen=20)  # (text, attr key); resized to the panel
         self.input_queue = queue.Queue()
+        self._stop = threading.Event()  # Tells the input thread to exit
+        self._input_timeout_ms = 200  # Longest getch wait before checking _stop
+        self.input_thread = None
         self.current_selection = 0
         self.selectable_items = []  # List of (type, id, description) tuples
+        self._entities_sig = None  # (id, name, type) per entity behind selectable_items
+        # Display rows read from the entity views. The game only refreshes
+        # those views on full-sync ticks (game_data['full']), so the rows are
+        # re-read only after one of those
+        self._entity_rows = ()
+        self._entities_stale = True
+        # Resources only need re-reading when the game reports deltas for them
+        self._resources_stale = True
+        self._force_redraw = True  # Repaint the whole screen on the next render
+        self._overlay = None  # Active show_message window and its expiry time
+        self.attr = {}  # Named curses attributes, resolved once in initialize()
+        self._cap_cache = {}  # Resource name -> capitalized label
+        self._sep = ""  # Resources panel rule, sized in _create_windows
+        
+        # Content fingerprint of what each panel last drew; a panel whose
+        # fingerprint is unchanged is skipped entirely
+        self._last_sig = {'header': None, 'resources': None, 'entities': None,
+                          'events': None, 'controls': None}
+        self._events_logged = 0  # Total events ever appended to event_log
+        self._dirty = set()  # Windows drawn into since their last noutrefresh
+        
+        # Frame-rate cap: renders closer together than this are dropped
+        # unless input is pending or they carry events (which would be lost)
+        self._last_render_ts = 0.0
+        self._min_frame_dt = 1 / 30
         
         # Display dimensions (calculated on init)
         self.height = 0
@@ -35,6 +92,12 @@ class NCursesDisplay:
             'events': {'y': 23, 'height': 8},
             'controls': {'y': 31, 'height': 4}
         }
+        self._full_layouts = self.layouts
+        
+        # Terminal resizes are noticed by the input thread (as KEY_RESIZE) and
+        # applied by the next render, which rebuilds the windows
+        self._needs_resize = False
+        self._pending_size = (0, 0)
     
     def initialize(self):
         """Initialize ncurses"""
@@ -42,7 +105,8 @@ class NCursesDisplay:
         curses.noecho()
         curses.cbreak()
         self.stdscr.keypad(True)
-        self.stdscr.nodelay(True)  # Non-blocking input
+        # Input thread blocks in getch, waking periodically to notice cleanup()
+        self.stdscr.timeout(self._input_timeout_ms)
         curses.curs_set(0)  # Hide cursor
         
         # Get screen dimensions
@@ -64,15 +128,49 @@ class NCursesDisplay:
             
             self.colors_initialized = True
         
+        self._build_attrs()
+        
         # Create windows
         self._create_windows()
         
+        # From here on stdscr belongs to the input thread. Stage it once so
+        # getch finds nothing pending and never refreshes it behind the
+        # panels; the main thread draws only into the newwin panels.
+        self.stdscr.noutrefresh()
+        
         # Start input handler thread
         self.input_thread = threading.Thread(target=self._input_handler, daemon=True)
         self.input_thread.start()
     
+    def _build_attrs(self):
+        """Resolve every attribute the panels draw with into self.attr"""
+        bold, reverse = curses.A_BOLD, curses.A_REVERSE
+        if self.colors_initialized:
+            pair = curses.color_pair
+            self.attr = {
+                'title': pair(2) | bold,
+                'resources_title': pair(6) | bold,
+                'entities_title': pair(5) | bold,
+                'events_title': pair(4) | bold,
+                'controls_title': pair(2) | bold,
+                'resource': pair(6),
+                'amount': pair(1),
+                'rate': pair(2),
+                'info': pair(4),
+                'hint': pair(2),
+                'success': pair(1),
+                'selected': pair(7) | reverse,
+            }
+        else:
+            self.attr = dict.fromkeys(('title', 'resources_title', 'entities_title',
+                                       'events_title', 'controls_title'), bold)
+            self.attr.update(dict.fromkeys(('resource', 'amount', 'rate', 'info',
+                                            'hint', 'success'), 0))
+            self.attr['selected'] = reverse
+        self.attr['default'] = 0
+    
     def _create_windows(self):
-        """Create all display windows"""
+        """Create all display windows (also rebuilds them after a resize)"""
         # Adjust layouts based on screen size
         if self.height < 35:
             # Compact layout for smaller terminals
@@ -83,63 +181,177 @@ class NCursesDisplay:
                 'events': {'y': 16, 'height': 6},
                 'controls': {'y': 22, 'height': 3}
             }
+        else:
+            self.layouts = self._full_layouts
         
-        for name, layout in self.layouts.items():
-            height = min(layout['height'], self.height - layout['y'] - 1)
+        self.windows = {}
+        if self.width < MIN_WIDTH:
+            # Panel titles would not fit; say so instead of drawing broken panels
+            notice = curses.newwin(self.height, self.width, 0, 0)
+            notice.leaveok(True)
+            notice.addstr(0, 0, "Terminal too small"[:self.width - 1])
+            self.windows['notice'] = notice
+        else:
             width = self.width - 2
-            if height > 0 and width > 0:
-                self.windows[name] = curses.newwin(height, width, layout['y'], 1)
-                self.windows[name].box()
+            for name, layout in self.layouts.items():
+                # Panels need a row inside their box (the header draws on its border)
+                height = min(layout['height'], self.height - layout['y'] - 1)
+                if height >= (2 if name == 'header' else 3):
+                    win = curses.newwin(height, width, layout['y'], 1)
+                    # The cursor is hidden, so don't move it after each refresh
+                    win.leaveok(True)
+                    win.box()
+                    self.windows[name] = win
+        
+        # Keep exactly as many events as the events panel can show
+        if 'events' in self.windows:
+            rows = self.windows['events'].getmaxyx()[0] - 3
+            self.event_log = deque(self.event_log, maxlen=max(1, rows))
+        
+        # Width-dependent strings are rebuilt with the windows
+        self._sep = "─" * max(0, self.width - 6)
+        
+        # Fresh windows are empty, so every panel must be drawn again
+        self._last_sig = dict.fromkeys(self._last_sig)
+        self._resources_stale = True
+        self._dirty = set(self.windows)
+        self._overlay = None
     
     def _input_handler(self):
-        """Handle keyboard input in separate thread"""
-        while True:
+        """Handle keyboard input in separate thread (the only user of stdscr)"""
+        while not self._stop.is_set():
             try:
-                key = self.stdscr.getch()
-                if key != -1:  # Valid key pressed
-                    self.input_queue.put(key)
-                time.sleep(0.02)  # Smaller delay for better responsiveness
-            except:
+                key = self.stdscr.getch()  # Blocks until a key or the timeout
+            except curses.error:
                 break
+            if key == curses.KEY_RESIZE:
+                # ncurses has already resized stdscr; hand the size to render()
+                self._pending_size = self.stdscr.getmaxyx()
+                # The resize also marks stdscr touched; clear that, or the next
+                # getch would repaint (clear) the screen from this thread
+                self.stdscr.untouchwin()
+                self._needs_resize = True
+            elif key != -1:  # Valid key pressed
+                self.input_queue.put(key)
     
     def render(self, game_data):
         """Render complete game state"""
-        try:
-            # Update selectable items first
+        # Both flags are kept even if this frame is skipped
+        if game_data.get('full', True):
+            self._entities_stale = True
+        deltas = game_data.get('deltas')
+        if deltas is None or any(deltas.values()):
+            self._resources_stale = True
+        
+        now = time.monotonic()
+        if (now - self._last_render_ts < self._min_frame_dt and self.input_queue.empty()
+                and not game_data.get('events') and not self._needs_resize):
+            return
+        self._last_render_ts = now
+        
+        if self._needs_resize:
+            self._needs_resize = False
+            self.height, self.width = self._pending_size
+            self._create_windows()
+            self._force_redraw = True
+        
+        # Update selectable items first
+        if self._entities_stale:
+            self._entities_stale = False
             self._update_selectable_items(game_data)
-            
-            # Clear all windows
-            for window in self.windows.values():
-                window.clear()
-                window.box()
-            
-            # Render each section
+        
+        # Anything printed to the terminal outside curses (e.g. startup
+        # messages, or a pre-resize frame) is only wiped out by a full repaint
+        if self._force_redraw and self.windows:
+            next(iter(self.windows.values())).clearok(True)
+            self._force_redraw = False
+        
+        # Events are logged before any drawing so a dropped frame keeps them
+        self._log_events(game_data)
+        
+        # Render each section (boxes are drawn once in _create_windows and
+        # every field is written padded, so no per-frame clear is needed)
+        try:
             self._render_header(game_data)
             self._render_resources(game_data)
             self._render_entities(game_data)
-            self._render_events(game_data)
+            self._render_events()
             self._render_controls()
-            
-            # Refresh all windows at once
-            for window in self.windows.values():
-                window.noutrefresh()  # Stage refresh without immediate update
-            
-            # Update screen once
-            curses.doupdate()  # Actually update the terminal
-            
         except curses.error:
-            # Handle terminal resize or other display errors gracefully
-            pass
+            # ncurses shrinks every window as soon as the input thread sees the
+            # resize, possibly mid-frame; drop this frame, since the next render
+            # rebuilds the layout. Any other drawing error is a real bug.
+            if not curses.is_term_resized(self.height, self.width):
+                raise
+            return
+        
+        # Stage only the windows drawn into this frame, then let ncurses send
+        # only the changed cells
+        windows = self.windows
+        for name in self._dirty:
+            windows[name].noutrefresh()
+        self._dirty.clear()
+        if self._overlay:
+            self._render_overlay(now)
+        curses.doupdate()
+    
+    def _put(self, win, row, text, attr=0, col=2, width=None):
+        """Write text at (row, col), space-padded to width so stale cells are overwritten"""
+        if width is None:
+            width = self.width - 4 - col  # up to the content edge of the panel
+        win.addstr(row, col, text[:width], attr)
+        # Pad from the cursor: wide characters (emoji) take two cells
+        pad = col + width - win.getyx()[1]
+        if pad > 0:
+            win.addstr(" " * pad)
+    
+    def _put_runs(self, win, row, runs, col=2):
+        """Write (text, attr) runs back to back from (row, col), padded to the panel edge
+        
+        Only the first run moves the cursor, so ncurses sees one contiguous
+        write per row and emits an attribute change only between runs.
+        """
+        win.move(row, col)
+        end = self.width - 4
+        for text, attr in runs:
+            room = end - win.getyx()[1]
+            if text and room > 0:
+                win.addstr(text[:room], attr)
+        pad = end - win.getyx()[1]
+        if pad > 0:
+            win.addstr(" " * pad)
+    
+    def _blank_rows(self, win, first_row):
+        """Blank the content area from first_row down to the bottom border"""
+        blank = " " * (self.width - 6)
+        for row in range(first_row, win.getmaxyx()[0] - 1):
+            win.addstr(row, 2, blank)
+    
+    def _panel_changed(self, panel, sig):
+        """Record a panel's content fingerprint; False if it is already drawn"""
+        if self._last_sig[panel] == sig:
+            return False
+        self._last_sig[panel] = sig
+        self._dirty.add(panel)
+        return True
     
     def _update_selectable_items(self, game_data):
-        """Update list of items player can interact with"""
-        self.selectable_items = []
-        
-        entities = game_data.get('entities', {})
-        for entity_id, entity_data in entities.items():
-            name = entity_data.get('name', entity_id)
-            entity_type = entity_data.get('type', 'unknown')
-            self.selectable_items.append(('boost', entity_id, f"Boost {name} ({entity_type})"))
+        """Re-read the entity views and update the items player can interact with"""
+        # Entity views are updated in place by the game, so copy out the values
+        # (efficiency and experience in tenths, as displayed). These rows are
+        # both the entities panel fingerprint and what it draws.
+        self._entity_rows = rows = tuple(
+            (entity_id, d.get('name', entity_id), d.get('type', 'unknown'),
+             d.get('task', 'idle'), round(d.get('efficiency', 1.0) * 10),
+             round(d.get('experience', 0.0) * 10))
+            for entity_id, d in game_data.get('entities', {}).items())
+        
+        # Items are rebuilt only when the set of entities (or their names/types) changes
+        sig = tuple(row[:3] for row in rows)
+        if sig != self._entities_sig:
+            self._entities_sig = sig
+            self.selectable_items = [('boost', entity_id, f"Boost {name} ({entity_type})")
+                                     for entity_id, name, entity_type in sig]
         
         # Ensure selection is within bounds
         if self.current_selection >= len(self.selectable_items):
@@ -152,15 +364,19 @@ class NCursesDisplay:
         
         win = self.windows['header']
         
+        # The tick counter only needs to move every 5 ticks
+        if not self._panel_changed('header', game_data.get('tick', 0) // 5):
+            return
+        
         # Title
         title = "IDLE STUFF"
         win.addstr(1, (self.width - len(title)) // 2, title, 
-                  curses.color_pair(2) | curses.A_BOLD if self.colors_initialized else curses.A_BOLD)
+                  self.attr['title'])
         
         # Tick counter
         tick_info = f"Tick: {game_data.get('tick', 0)}"
         win.addstr(1, self.width - len(tick_info) - 5, tick_info, 
-                  curses.color_pair(4) if self.colors_initialized else 0)
+                  self.attr['info'])
     
     def _render_resources(self, game_data):
         """Render resources panel"""
@@ -169,41 +385,54 @@ class NCursesDisplay:
         
         win = self.windows['resources']
         
-        # Section title
-        win.addstr(0, 2, " RESOURCES ", curses.color_pair(6) | curses.A_BOLD if self.colors_initialized else curses.A_BOLD)
+        # Nothing changed since the last time the panel was fingerprinted
+        if not self._resources_stale:
+            return
+        self._resources_stale = False
         
+        # Fingerprint and draw the values at display precision (amount in
+        # tenths, rate in hundredths), so sub-display jitter redraws nothing
         resources = game_data.get('resources', {})
         production_rates = game_data.get('production_rates', {})
+        rows = tuple((name, round(amount * 10), round(production_rates.get(name, 0) * 100))
+                     for name, amount in resources.items())
+        if not self._panel_changed('resources', rows):
+            return
+        
+        # Section title
+        win.addstr(0, 2, " RESOURCES ", self.attr['resources_title'])
+        
+        bottom = win.getmaxyx()[0] - 1  # First row of the bottom border
+        attr_name = self.attr['resource']
+        attr_amount = self.attr['amount']
+        attr_rate = self.attr['rate']
+        cap_cache = self._cap_cache
         
         row = 2
-        for name, amount in resources.items():
-            if row >= win.getmaxyx()[0] - 1:
+        for name, amount_tenths, rate_hundredths in rows:
+            if row >= bottom:
                 break
             
-            rate = production_rates.get(name, 0)
-            
-            # Resource name
-            win.addstr(row, 2, f"{name.capitalize()}:", 
-                      curses.color_pair(6) if self.colors_initialized else 0)
-            
-            # Amount
-            amount_str = f"{amount:.1f}"
-            win.addstr(row, 15, amount_str, 
-                      curses.color_pair(1) if self.colors_initialized else 0)
+            label = cap_cache.get(name)
+            if label is None:
+                label = cap_cache[name] = name.capitalize()
+            name_str, amount_str, rate_str = _fmt_resource(label, amount_tenths,
+                                                           rate_hundredths)
             
-            # Production rate
-            if rate > 0:
-                rate_str = f"(+{rate:.2f}/tick)"
-                win.addstr(row, 25, rate_str, 
-                          curses.color_pair(2) if self.colors_initialized else 0)
+            # Name, amount and rate (blank when not producing) in one pass
+            self._put_runs(win, row, ((name_str, attr_name),
+                                      (amount_str, attr_amount),
+                                      (rate_str, attr_rate)))
             
             row += 1
         
+        self._blank_rows(win, row)
+        
         # Add some usage stats
-        if row < win.getmaxyx()[0] - 2:
-            win.addstr(row + 1, 2, "─" * (self.width - 6))
-            win.addstr(row + 2, 2, f"Total Resources: {len(resources)}", 
-                      curses.color_pair(4) if self.colors_initialized else 0)
+        if row < bottom - 1:
+            self._put(win, row + 1, self._sep)
+            self._put(win, row + 2, f"Total Resources: {len(resources)}",
+                      self.attr['info'])
     
     def _render_entities(self, game_data):
         """Render entities panel"""
@@ -212,87 +441,89 @@ class NCursesDisplay:
         
         win = self.windows['entities']
         
+        # Rows only change on full-sync frames; otherwise just the selection can
+        rows = self._entity_rows
+        if not self._panel_changed('entities', (self.current_selection, rows)):
+            return
+        
         # Section title
-        win.addstr(0, 2, " ENTITIES ", curses.color_pair(5) | curses.A_BOLD if self.colors_initialized else curses.A_BOLD)
+        win.addstr(0, 2, " ENTITIES ", self.attr['entities_title'])
         
-        entities = game_data.get('entities', {})
+        bottom = win.getmaxyx()[0] - 1
+        selection = self.current_selection
+        attr_selected = self.attr['selected']
+        attr_info = self.attr['info']
         
         row = 2
-        entity_list = list(entities.items())
-        
-        for i, (entity_id, entity_data) in enumerate(entity_list):
-            if row >= win.getmaxyx()[0] - 1:
+        for i, (_, name, entity_type, task, eff_tenths, exp_tenths) in enumerate(rows):
+            if row >= bottom:
                 break
             
             # Highlight if selected
-            attr = 0
-            if self.current_selection == i and self.colors_initialized:
-                attr = curses.color_pair(7)
-            if self.current_selection == i:
-                attr |= curses.A_REVERSE
+            attr = attr_selected if selection == i else 0
             
             # Entity info line
-            name = entity_data.get('name', entity_id)
-            entity_type = entity_data.get('type', 'unknown')
-            task = entity_data.get('task', 'idle')
-            info_line = f"{name} ({entity_type}) - {task}"
+            info_line, stats_line = _fmt_entity(name, entity_type, task,
+                                                eff_tenths, exp_tenths)
             
-            win.addstr(row, 2, info_line[:self.width-6], attr)
+            self._put_runs(win, row, ((info_line, attr),))
             
             # Stats line
-            if row + 1 < win.getmaxyx()[0] - 1:
-                efficiency = entity_data.get('efficiency', 1.0)
-                experience = entity_data.get('experience', 0.0)
-                stats_line = f"  Eff: {efficiency:.1f} | Exp: {experience:.1f}"
-                win.addstr(row + 1, 2, stats_line, 
-                          curses.color_pair(4) if self.colors_initialized else 0)
+            if row + 1 < bottom:
+                self._put(win, row + 1, stats_line, attr_info)
+            
+            # Spacer line between entities
+            if row + 2 < bottom:
+                self._put(win, row + 2, "")
             
             row += 3
         
+        self._blank_rows(win, row)
+        
         # Controls hint
-        if row < win.getmaxyx()[0] - 2:
-            win.addstr(row, 2, "↑↓: Select | SPACE: Boost", 
-                      curses.color_pair(2) if self.colors_initialized else 0)
+        if row < bottom - 1:
+            self._put(win, row, "↑↓: Select | SPACE: Boost",
+                      self.attr['hint'])
+    
+    def _log_events(self, game_data):
+        """Add new events to the log, color coded by event type"""
+        for event in game_data.get('events', []):
+            if event.get('type') == 'discovery':
+                self.event_log.append((f"🔍 {event['message']}", 'success'))
+            elif event.get('type') == 'system':
+                self.event_log.append((f"💾 {event['message']}", 'info'))
+            else:
+                self.event_log.append((f"• {event.get('message', str(event))}", 'default'))
+            self._events_logged += 1
     
-    def _render_events(self, game_data):
+    def _render_events(self):
         """Render events log"""
         if 'events' not in self.windows:
             return
         
         win = self.windows['events']
         
-        # Section title
-        win.addstr(0, 2, " EVENTS ", curses.color_pair(4) | curses.A_BOLD if self.colors_initialized else curses.A_BOLD)
+        # The log only changes when events are appended
+        if not self._panel_changed('events', self._events_logged):
+            return
         
-        # Add new events to log
-        for event in game_data.get('events', []):
-            if event.get('type') == 'discovery':
-                self.event_log.append(f"🔍 {event['message']}")
-            elif event.get('type') == 'system':
-                self.event_log.append(f"💾 {event['message']}")
-            else:
-                self.event_log.append(f"• {event.get('message', str(event))}")
+        # Section title
+        win.addstr(0, 2, " EVENTS ", self.attr['events_title'])
         
         # Display recent events
-        row = 2
-        max_rows = win.getmaxyx()[0] - 3
+        bottom = win.getmaxyx()[0] - 1
+        attrs = self.attr
         
-        for event in list(self.event_log)[-max_rows:]:
-            if row >= win.getmaxyx()[0] - 1:
+        row = 2
+        for text, attr_key in self.event_log:
+            if row >= bottom:
                 break
             
-            # Truncate long messages
-            display_event = event[:self.width-6] if len(event) > self.width-6 else event
-            
-            # Color code different event types
-            attr = 0
-            if '🔍' in event:
-                attr = curses.color_pair(1) if self.colors_initialized else 0
-            elif '💾' in event:
-                attr = curses.color_pair(4) if self.colors_initialized else 0
-            
-            win.addstr(row, 2, display_event, attr)
+            # _put truncates long messages to the panel width
+            self._put(win, row, text, attrs[attr_key])
             row += 1
+        
+        self._blank_rows(win, row)
     
     def _render_controls(self):
         """Render controls help"""
@@ -301,56 +532,85 @@ class NCursesDisplay:
         
         win = self.windows['controls']
         
+        # Static text: drawn once per window
+        if not self._panel_changed('controls', True):
+            return
+        
         # Section title
-        win.addstr(0, 2, " CONTROLS ", curses.color_pair(2) | curses.A_BOLD if self.colors_initialized else curses.A_BOLD)
+        win.addstr(0, 2, " CONTROLS ", self.attr['controls_title'])
         
         controls = [
             "↑↓: Navigate | SPACE: Boost Entity | S: Save Game | Q: Quit",
             "R: Reset Selection | +/-: Adjust Game Speed"
         ]
         
+        bottom = win.getmaxyx()[0] - 1
         row = 1
         for control_line in controls:
-            if row < win.getmaxyx()[0] - 1:
-                win.addstr(row, 2, control_line[:self.width-6])
+            if row < bottom:
+                self._put(win, row, control_line)
                 row += 1
     
     def get_input(self):
-        """Get player input (non-blocking)"""
-        try:
-            key = self.input_queue.get_nowait()
+        """Get player input (non-blocking)
+        
+        Drains every queued key up to the next action key, folding runs of
+        arrow keys into a single selection update so key-repeat never lags
+        behind the render cadence. Keys after an action stay queued for the
+        next call.
+        """
+        last = len(self.selectable_items) - 1
+        selection = self.current_selection
+        nav = 0
+        action = None
+        while action is None:
+            try:
+                key = self.input_queue.get_nowait()
+            except queue.Empty:
+                break
             
             # Handle navigation
             if key == curses.KEY_UP:
-                self.current_selection = max(0, self.current_selection - 1)
-                return "nav_up"
+                selection = max(0, selection - 1)
+                nav = -1
             elif key == curses.KEY_DOWN:
-                self.current_selection = min(len(self.selectable_items) - 1, self.current_selection + 1)
-                return "nav_down"
+                selection = min(last, selection + 1)
+                nav = 1
             elif key == ord(' '):  # Spacebar
-                if 0 <= self.current_selection < len(self.selectable_items):
-                    item = self.selectable_items[self.current_selection]
-                    return f"boost:{item[1]}"  # Return boost:entity_id
-                return "boost"
-            elif key == ord('s') or key == ord('S'):
-                return "save"
-            elif key == ord('q') or key == ord('Q'):
-                return "quit"
-            elif key == ord('r') or key == ord('R'):
-                self.current_selection = 0
-                return "reset"
-            elif key == ord('+') or key == ord('='):
-                return "speed_up"
-            elif key == ord('-'):
-                return "speed_down"
-            
-        except queue.Empty:
-            pass
-        
-        return None
+                action = key
+            elif key in (ord('s'), ord('S'), ord('q'), ord('Q'), ord('r'), ord('R'),
+                         ord('+'), ord('='), ord('-')):
+                action = key
+        
+        self.current_selection = selection
+        
+        if action is None:
+            if nav:
+                return "nav_up" if nav < 0 else "nav_down"
+            return None
+        
+        if action == ord(' '):
+            if 0 <= self.current_selection < len(self.selectable_items):
+                item = self.selectable_items[self.current_selection]
+                return f"boost:{item[1]}"  # Return boost:entity_id
+            return "boost"
+        elif action == ord('s') or action == ord('S'):
+            return "save"
+        elif action == ord('q') or action == ord('Q'):
+            return "quit"
+        elif action == ord('r') or action == ord('R'):
+            self.current_selection = 0
+            return "reset"
+        elif action == ord('+') or action == ord('='):
+            return "speed_up"
+        return "speed_down"
     
     def cleanup(self):
         """Cleanup ncurses resources"""
+        self._stop.set()
+        if self.input_thread:
+            # Wait for the pending getch to time out before touching stdscr
+            self.input_thread.join(self._input_timeout_ms / 1000 * 2)
         if self.stdscr:
             curses.nocbreak()
             self.stdscr.keypad(False)
@@ -358,31 +618,45 @@ class NCursesDisplay:
             curses.endwin()
     
     def show_message(self, message: str, duration: float = 2.0):
-        """Show a temporary message overlay"""
-        if not self.stdscr:
-            return
+        """Show a temporary message overlay
         
-        # Create message window
+        Returns immediately; render() keeps the overlay on top of the panels
+        until it expires.
+        """
+        # Create message window (skipped when the terminal cannot fit it)
         msg_height = 5
+        if not self.windows or self.height < msg_height or self.width < MIN_WIDTH:
+            return
         msg_width = min(len(message) + 4, self.width - 4)
         msg_y = (self.height - msg_height) // 2
         msg_x = (self.width - msg_width) // 2
         
         msg_win = curses.newwin(msg_height, msg_width, msg_y, msg_x)
+        msg_win.leaveok(True)
         msg_win.box()
         
         # Display message
         msg_win.addstr(2, 2, message[:msg_width-4], 
-                      curses.color_pair(2) | curses.A_BOLD if self.colors_initialized else curses.A_BOLD)
-        msg_win.refresh()
+                      self.attr['title'])
+        msg_win.noutrefresh()
+        curses.doupdate()
         
-        # Keep displayed for duration
-        time.sleep(duration)
+        self._overlay = {'win': msg_win, 'expires_at': time.monotonic() + duration}
+    
+    def _render_overlay(self, now):
+        """Keep the message overlay above the panels, or remove it once expired"""
+        overlay = self._overlay
+        if now < overlay['expires_at']:
+            # Panels may have repainted cells underneath; put the overlay back
+            overlay['win'].touchwin()
+            overlay['win'].noutrefresh()
+            return
         
-        # Clean up
-        msg_win.clear()
-        msg_win.refresh()
-        del msg_win
+        # Clean up: repaint the panels the message was covering
+        self._overlay = None
+        for window in self.windows.values():
+            window.touchwin()
+            window.noutrefresh()
 
 
 # =============================================================================